@@ -214,7 +214,7 @@ if run and job_title and location:
 
     # ── BLS broader SOC fallback (for thin/missing occupations) ───────────────
     if "bls_oews" not in results:
-        for broader_soc in soc_mapper.fallback_chain(soc_code):
+        for broader_soc in soc_mapper.iter_fallback_chain(soc_code):
             with st.spinner(f"BLS data sparse for this occupation — trying broader group ({broader_soc})…"):
                 data = bls.get_oews(broader_soc, area_code="0000000", area_type="national")
                 if data:
@@ -224,8 +224,8 @@ if run and job_title and location:
 
     # ── USAJobs ────────────────────────────────────────────────────────────────
     with st.spinner("Scanning USAJobs postings for salary ranges…"):
-        postings = usajobs.search(job_title, location)
-        if postings:
+        postings = usajobs.search_frame(job_title, location)
+        if not postings.empty:
             results["usajobs"] = postings
 
     # ── JSearch (Indeed + LinkedIn + Glassdoor) ────────────────────────────────
@@ -325,9 +325,9 @@ if run and job_title and location:
           </div>
         """, unsafe_allow_html=True)
 
-        df = pd.DataFrame(postings)[["title", "salary_min", "salary_max", "pay_scale", "location", "url"]]
-        df["salary_min"] = df["salary_min"].apply(lambda x: f"${x:,.0f}" if x else "—")
-        df["salary_max"] = df["salary_max"].apply(lambda x: f"${x:,.0f}" if x else "—")
+        df = postings[["title", "salary_min", "salary_max", "pay_scale", "location", "url"]].copy()
+        df["salary_min"] = df["salary_min"].apply(lambda x: f"${x:,.0f}" if pd.notna(x) else "—")
+        df["salary_max"] = df["salary_max"].apply(lambda x: f"${x:,.0f}" if pd.notna(x) else "—")
         df.columns = ["Title", "Min", "Max", "Pay Scale", "Location", "Link"]
         st.dataframe(df, use_container_width=True, hide_index=True)
         st.markdown("</div>", unsafe_allow_html=True)
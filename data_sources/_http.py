@@ -0,0 +1,33 @@
+"""
+Shared HTTP Session
+===================
+One process-wide requests.Session for the data-source clients, so a
+query that fans out to several providers reuses a single set of
+keep-alive pools (one per host) instead of each client building its own.
+
+Clients accept an optional `session=` and default to SESSION. Client-
+specific headers (API keys, bearer tokens) are passed per request and
+never set on SESSION.headers, so they cannot leak to another provider.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Transient 429/5xx are retried with exponential backoff plus jitter,
+# honouring Retry-After. POST is included because the POSTs sent through
+# here (OAuth token, wage queries) are read-only.
+RETRY = Retry(
+    total=5,
+    backoff_factor=1.5,
+    backoff_jitter=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET", "POST"],
+    respect_retry_after_header=True,
+)
+
+# pool_connections = distinct hosts kept warm; pool_maxsize = keep-alive
+# connections per host, comfortably above any client's worker count.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=100, max_retries=RETRY))
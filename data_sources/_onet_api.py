@@ -0,0 +1,81 @@
+"""
+Shared O*NET Web Services Search
+================================
+The authenticated keyword search used by both ONETClient modules
+(onet.py and data_sources/onet.py). Keeping one copy means one
+"onet_api" disk cache writer and one process-wide rate limit.
+"""
+
+import time
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is an optional speedup; stdlib json also accepts bytes
+    from json import loads as _json_loads
+
+from utils.cache import DiskCache
+from utils.ratelimit import TokenBucket
+
+
+ONET_BASE = "https://services.onetcenter.org/ws/"
+
+# Keyword → SOC matches are effectively static for months. Entries older
+# than API_CACHE_MAX_AGE are revalidated with a conditional GET; the disk
+# TTL is longer so the ETag survives to be revalidated.
+API_CACHE_MAX_AGE = 86400 * 30
+API_CACHE         = DiskCache("onet_api", default_ttl=86400 * 90)
+
+# Free-tier O*NET Web Services allow 5 requests/second. The only bucket in
+# the process: every client and search_occupations_many worker shares it.
+LIMITER = TokenBucket(300, burst=5)
+
+
+def search(session, title: str, key: str) -> list[dict]:
+    """
+    Keyword search for title, cached on disk under key (the caller's
+    normalized title). Fresh entries are served without a request; stale
+    ones are revalidated with If-None-Match / If-Modified-Since and reused
+    on 304. Errors fall back to the stale entry, else [].
+    """
+    cached = API_CACHE.get(key)
+    if cached and time.time() - cached["fetched"] < API_CACHE_MAX_AGE:
+        return cached["results"]
+
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        with LIMITER:
+            resp = session.get(
+                f"{ONET_BASE}search",
+                params={"keyword": title, "start": 1, "end": 10, "fmt": "json"},
+                headers=headers,
+                timeout=10,
+            )
+        if cached and resp.status_code == 304:
+            results = cached["results"]
+        else:
+            resp.raise_for_status()
+            data = _json_loads(resp.content)
+            results = [
+                {
+                    "code":   occ.get("code", ""),
+                    "title":  occ.get("title", ""),
+                    "score":  occ.get("relevance_score", 0.5),
+                    "source": "onet_api",
+                }
+                for occ in data.get("occupation", [])
+            ]
+        API_CACHE.set(key, {
+            "results":       results,
+            "fetched":       time.time(),
+            "etag":          resp.headers.get("ETag") or headers.get("If-None-Match"),
+            "last_modified": resp.headers.get("Last-Modified") or headers.get("If-Modified-Since"),
+        })
+        return results
+    except Exception as e:
+        print(f"[O*NET] API search error: {e}")
+        return cached["results"] if cached else []
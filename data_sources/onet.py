@@ -12,10 +12,12 @@ Set ONET_USERNAME / ONET_PASSWORD in Streamlit secrets.
 import os
 import requests
 import re
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from difflib import SequenceMatcher
 
-
-ONET_BASE = "https://services.onetcenter.org/ws/"
+from data_sources import _onet_api
+from data_sources._onet_api import ONET_BASE  # re-exported; the search lives in _onet_api
 
 
 # ── Curated title → SOC map ───────────────────────────────────────────────────
@@ -414,6 +416,9 @@ LOCAL_TITLE_MAP = {
     "payroll manager":                 ("11-3111.00", "Compensation and Benefits Managers"),
 }
 
+# Read-only view: the map is shared by every client and never mutated at runtime.
+LOCAL_TITLE_MAP = MappingProxyType(LOCAL_TITLE_MAP)
+
 
 def _normalize(title: str) -> str:
     """Lowercase, collapse whitespace, strip punctuation variants."""
@@ -447,8 +452,9 @@ class ONETClient:
         results = []
 
         # 1. Exact local match
-        if normalized in LOCAL_TITLE_MAP:
-            code, onet_title = LOCAL_TITLE_MAP[normalized]
+        exact = LOCAL_TITLE_MAP.get(normalized)
+        if exact is not None:
+            code, onet_title = exact
             results.append({
                 "code":   code,
                 "title":  onet_title,
@@ -456,10 +462,18 @@ class ONETClient:
                 "source": "local_map",
             })
 
-        # 2. Fuzzy match — threshold 0.68 to avoid false positives
-        scored = []
+        # 2. Fuzzy match — threshold 0.68 to avoid false positives.
+        # One matcher, query as seq1 like SequenceMatcher(None, query, key):
+        # ratio() depends on the order. The cheap upper bounds reject most
+        # keys before the full ratio().
+        scored  = []
+        matcher = SequenceMatcher(None)
+        matcher.set_seq1(normalized)
         for key, (code, onet_title) in LOCAL_TITLE_MAP.items():
-            ratio = SequenceMatcher(None, normalized, key).ratio()
+            matcher.set_seq2(key)
+            if matcher.real_quick_ratio() < 0.68 or matcher.quick_ratio() < 0.68:
+                continue
+            ratio = matcher.ratio()
             if ratio >= 0.68:
                 scored.append((ratio, code, onet_title, key))
 
@@ -470,7 +484,7 @@ class ONETClient:
                 results.append({
                     "code":   code,
                     "title":  onet_title,
-                    "score":  round(ratio, 3),
+                    "score":  ratio,
                     "source": f"fuzzy→{matched_key}",
                 })
                 seen_codes.add(code)
@@ -484,25 +498,28 @@ class ONETClient:
 
         return results[:max_results]
 
+    def search_occupations_many(
+        self,
+        titles:      list[str],
+        max_results: int = 5,
+        max_workers: int = 5,
+    ) -> list[list[dict]]:
+        """
+        Batch form of search_occupations(), results in input order.
+        Titles that fall through to the O*NET API are searched concurrently
+        on a thread pool sharing this client's session, so N API-bound
+        titles cost roughly one round-trip per max_workers instead of N.
+        API requests from every worker draw on one shared TokenBucket, so
+        the batch stays within the free-tier 5 req/sec limit.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda t: self.search_occupations(t, max_results), titles))
+
     def _api_search(self, title: str) -> list[dict]:
-        """Authenticated O*NET keyword search."""
-        try:
-            resp = self.session.get(
-                f"{ONET_BASE}search",
-                params={"keyword": title, "start": 1, "end": 10, "fmt": "json"},
-                timeout=10,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            return [
-                {
-                    "code":   occ.get("code", ""),
-                    "title":  occ.get("title", ""),
-                    "score":  occ.get("relevance_score", 0.5),
-                    "source": "onet_api",
-                }
-                for occ in data.get("occupation", [])
-            ]
-        except Exception as e:
-            print(f"[O*NET] API search error: {e}")
-            return []
+        """
+        Authenticated O*NET keyword search via the shared _onet_api helper:
+        disk-cached with conditional revalidation, under the process-wide
+        5 req/sec limit.
+        """
+        return _onet_api.search(self.session, title, _normalize(title))
+
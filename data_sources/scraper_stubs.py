@@ -15,9 +15,24 @@ Sources:
   - Carta / Pave (paid, startup equity focus)
 """
 
-from typing import Optional
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional
+from urllib.parse import quote
 import requests
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is an optional speedup
+    from json import loads as _json_loads
+
+from data_sources import _http
+from utils.cache import cache_dir
+from utils.ratelimit import TokenBucket
+
 
 # ─────────────────────────────────────────────────────────
 # SALARY TRANSPARENCY SCRAPING STRATEGY
@@ -32,10 +47,10 @@ import requests
 #
 # Indeed and LinkedIn both embed JSON-LD. Example extraction:
 #
-#   from bs4 import BeautifulSoup, import json
-#   soup = BeautifulSoup(html, "html.parser")
-#   for tag in soup.find_all("script", type="application/ld+json"):
-#       d = json.loads(tag.string)
+#   from selectolax.lexbor import LexborHTMLParser, import json
+#   tree = LexborHTMLParser(html)
+#   for tag in tree.css('script[type="application/ld+json"]'):
+#       d = json.loads(tag.text())
 #       if d.get("@type") == "JobPosting":
 #           base = d.get("baseSalary", {})
 #           range_ = base.get("value", {})
@@ -48,6 +63,50 @@ import requests
 # ─────────────────────────────────────────────────────────
 
 
+class ScrapedJob(NamedTuple):
+    """One scraped posting. A flat tuple: smaller and faster to build than a dict."""
+    title:      str
+    salary_min: float
+    salary_max: Optional[float]
+    location:   str
+    company:    str
+    source:     str
+    url:        str = ""
+
+
+def _dig(d, *keys):
+    """Walk nested JSON-LD dicts; None at the first missing key or non-dict step."""
+    for k in keys:
+        if not isinstance(d, dict):
+            return None
+        d = d.get(k)
+    return d
+
+
+_JSONLD_SELECTOR = 'script[type="application/ld+json"]'
+_JSONLD_XPATH    = None  # compiled on first use; lxml is only the fallback parser
+
+
+def _jsonld_payloads(html: str) -> list[str]:
+    """
+    Raw text of every JSON-LD <script> tag. Uses selectolax (lexbor) when
+    installed, else lxml with a precompiled XPath that yields the text
+    nodes directly. Raises ImportError if neither parser is available.
+    """
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        pass
+    else:
+        return [tag.text() for tag in LexborHTMLParser(html).css(_JSONLD_SELECTOR)]
+
+    global _JSONLD_XPATH
+    from lxml import etree, html as lxml_html
+    if _JSONLD_XPATH is None:
+        _JSONLD_XPATH = etree.XPath('//script[@type="application/ld+json"]/text()')
+    return [str(t) for t in _JSONLD_XPATH(lxml_html.fromstring(html))]
+
+
 class IndeedScraper:
     """
     Scrapes Indeed job postings for salary range data.
@@ -59,54 +118,94 @@ class IndeedScraper:
       playwright install chromium
     """
 
-    def __init__(self):
+    def __init__(self, rate_mode: str = "normal"):
         self.enabled = False  # Set True after installing playwright
+        self.limiter = TokenBucket.for_mode(rate_mode)
 
-    def search(self, job_title: str, location: str) -> list[dict]:
+    def search(self, job_title: str, location: str) -> list[ScrapedJob]:
         if not self.enabled:
             return []
+        batch = self.search_many([(job_title, location)])
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(batch)[0]
+        # Inside a running loop (async caller, notebook) asyncio.run raises,
+        # so run the batch on its own loop in a worker thread. That still
+        # blocks the caller's loop; async code should await search_many.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, batch).result()[0]
+
+    async def search_many(self, queries: list[tuple[str, str]], concurrency: int = 8) -> list[list[ScrapedJob]]:
+        """
+        Scrape many (job_title, location) pairs with ONE browser launch.
+        Each query runs in its own lightweight context, at most
+        `concurrency` at a time; results come back in input order and a
+        failed query yields [] instead of sinking the batch.
+        """
+        if not self.enabled:
+            return [[] for _ in queries]
 
-        # Pseudocode — implement with Playwright:
-        # from playwright.sync_api import sync_playwright
-        # with sync_playwright() as p:
-        #     browser = p.chromium.launch(headless=True)
-        #     page = browser.new_page()
-        #     url = f"https://www.indeed.com/jobs?q={quote(job_title)}&l={quote(location)}"
-        #     page.goto(url)
-        #     html = page.content()
-        #     return self._parse(html)
-        return []
+        from playwright.async_api import async_playwright
+
+        sem = asyncio.Semaphore(concurrency)
 
-    def _parse(self, html: str) -> list[dict]:
+        async def scrape(browser, job_title: str, location: str) -> list[ScrapedJob]:
+            async with sem:
+                context = await browser.new_context()
+                try:
+                    page = await context.new_page()
+                    await self.limiter.acquire_async()
+                    await page.goto(f"https://www.indeed.com/jobs?q={quote(job_title)}&l={quote(location)}")
+                    return self._parse(await page.content())
+                except Exception as e:
+                    print(f"[Indeed] Scrape failed for '{job_title}' @ '{location}': {e}")
+                    return []
+                finally:
+                    await context.close()
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            try:
+                return list(await asyncio.gather(*(scrape(browser, t, l) for t, l in queries)))
+            finally:
+                await browser.close()
+
+    def _parse(self, html: str) -> list[ScrapedJob]:
         """Parse JSON-LD from Indeed job cards."""
         results = []
         try:
-            from bs4 import BeautifulSoup
-            import json
-            soup = BeautifulSoup(html, "html.parser")
-            for tag in soup.find_all("script", type="application/ld+json"):
-                try:
-                    d = json.loads(tag.string or "")
-                    if d.get("@type") == "JobPosting":
-                        base = d.get("baseSalary", {})
-                        val  = base.get("value", {})
-                        unit = val.get("unitText", "YEAR")
-                        low  = val.get("minValue")
-                        high = val.get("maxValue")
-                        if low:
-                            mult = 2080 if unit == "HOUR" else 1
-                            results.append({
-                                "title":      d.get("title", ""),
-                                "salary_min": float(low) * mult,
-                                "salary_max": float(high) * mult if high else None,
-                                "location":   d.get("jobLocation", {}).get("address", {}).get("addressLocality", ""),
-                                "company":    d.get("hiringOrganization", {}).get("name", ""),
-                                "source":     "indeed_scrape",
-                            })
-                except Exception:
-                    pass
+            payloads = _jsonld_payloads(html)
         except ImportError:
-            print("[Indeed] beautifulsoup4 not installed. pip install beautifulsoup4")
+            print("[Indeed] selectolax not installed. pip install selectolax")
+            return results
+        for payload in payloads:
+            # Most JSON-LD blocks are BreadcrumbList/Organization/WebPage;
+            # a substring scan rejects them without a full decode. The
+            # @type check below still decides for the ones that pass.
+            if "JobPosting" not in payload:
+                continue
+            try:
+                d = _json_loads(payload)
+                if not isinstance(d, dict) or d.get("@type") != "JobPosting":
+                    continue
+                val = _dig(d, "baseSalary", "value")
+                low = val.get("minValue") if isinstance(val, dict) else None
+                if not low:
+                    continue
+                high = val.get("maxValue")
+                mult = 2080 if val.get("unitText") == "HOUR" else 1
+                results.append(ScrapedJob(
+                    title=d.get("title", ""),
+                    salary_min=float(low) * mult,
+                    salary_max=float(high) * mult if high else None,
+                    location=_dig(d, "jobLocation", "address", "addressLocality") or "",
+                    company=_dig(d, "hiringOrganization", "name") or "",
+                    source="indeed_scrape",
+                    url=d.get("url") or "",
+                ))
+            except Exception:
+                pass
         return results
 
 
@@ -143,15 +242,61 @@ class LightcastClient:
     Status: STUB
     """
 
-    def __init__(self, client_id: str = "", client_secret: str = ""):
+    # Bearer tokens live ~1h; persisting them lets a restarted process skip
+    # the token round trip. Only reused for the same client_id.
+    _TOKEN_PATH = os.path.join(cache_dir(), "lightcast.json")
+
+    def __init__(self, client_id: str = "", client_secret: str = "", session: Optional[requests.Session] = None):
         self.client_id     = client_id
         self.client_secret = client_secret
         self.token         = None
+        self.expires_at    = 0.0
+        self.session       = session or _http.SESSION
+        self.headers       = {}  # per-request; holds the bearer token
+        self._load_token()
+
+    def _set_token(self, token: str, expires_at: float):
+        self.token      = token
+        self.expires_at = expires_at
+        self.headers["Authorization"] = f"Bearer {token}"
+
+    def _expired(self, margin: float = 60) -> bool:
+        return self.expires_at <= time.time() + margin
+
+    def _load_token(self):
+        try:
+            with open(self._TOKEN_PATH) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (
+            isinstance(cached, dict)
+            and cached.get("client_id") == self.client_id
+            and cached.get("token")
+            and cached.get("expires_at", 0) > time.time() + 60
+        ):
+            self._set_token(cached["token"], cached["expires_at"])
+
+    def _save_token(self):
+        """Write the token atomically (tmp file + os.replace), owner-readable only."""
+        tmp = f"{self._TOKEN_PATH}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._TOKEN_PATH), exist_ok=True)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump({
+                    "client_id":  self.client_id,
+                    "token":      self.token,
+                    "expires_at": self.expires_at,
+                }, f)
+            os.replace(tmp, self._TOKEN_PATH)
+        except OSError as e:
+            print(f"[Lightcast] Could not persist token: {e}")
 
     def authenticate(self):
         if not self.client_id:
             return False
-        resp = requests.post(
+        resp = self.session.post(
             "https://auth.emsicloud.com/connect/token",
             data={
                 "client_id":     self.client_id,
@@ -159,15 +304,28 @@ class LightcastClient:
                 "grant_type":    "client_credentials",
                 "scope":         "emsi_open",
             },
+            timeout=15,
         )
-        self.token = resp.json().get("access_token")
-        return bool(self.token)
+        data  = resp.json()
+        token = data.get("access_token")
+        if not token:
+            return False
+        self._set_token(token, time.time() + float(data.get("expires_in", 3600)))
+        self._save_token()
+        return True
 
     def get_wages(self, soc_code: str, msa_fips: str) -> Optional[dict]:
         """Get wage distribution by SOC code and MSA FIPS."""
-        if not self.token:
-            return None
-        # POST to /apis/occupation-insight/wages with region filter
+        if not self.token or self._expired():
+            try:
+                if not self.authenticate():
+                    return None
+            except (requests.RequestException, ValueError) as e:
+                print(f"[Lightcast] Authentication error: {e}")
+                return None
+        # POST to /apis/occupation-insight/wages with region filter and
+        # headers=self.headers. Wage distributions move slowly per SOC/MSA,
+        # so add a week-long DiskCache alongside the real request.
         return None
 
 
@@ -197,13 +355,18 @@ class LevelsFyiClient:
     # Modern approach: their GraphQL endpoint with appropriate headers
     # Rate limit carefully; they detect bots.
 
+    def __init__(self, rate_mode: str = "conservative", session: Optional[requests.Session] = None):
+        self.limiter = TokenBucket.for_mode(rate_mode)
+        self.session = session or _http.SESSION
+
     def search(self, title: str, location: str) -> list[dict]:
         """
         Levels.fyi returns TC (total comp = base + bonus + equity/yr).
         Filter by location string matching.
         """
         # In production:
-        # 1. GET https://www.levels.fyi/graphql with the correct query
+        # 1. GET https://www.levels.fyi/graphql with the correct query via
+        #    self.session, wrapped in `with self.limiter:`
         # 2. Filter by location LIKE city name
         # 3. Aggregate p25/p50/p75 of totalComp field
         return []
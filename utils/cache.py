@@ -0,0 +1,130 @@
+"""
+Disk Cache
+==========
+Small persistent key → value store for API lookups that change slowly
+(O*NET keyword matches, Census geocodes, …), so warm restarts skip the
+network entirely.
+
+One SQLite file per cache under $XDG_CACHE_HOME/compscope
+(default ~/.cache/compscope). Values must be JSON-serializable and
+expire after their TTL. Expired rows are deleted when read and swept on
+open and every PURGE_EVERY writes; past max_bytes of stored values the
+soonest-expiring rows are evicted, so the files stop growing. If the
+cache directory is not writable the cache degrades to a no-op — callers
+never fail because of it.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+
+PURGE_EVERY       = 500              # writes between expiry/size sweeps
+DEFAULT_MAX_BYTES = 100 * 1024 ** 2  # per cache file, stored JSON bytes
+
+
+def cache_dir() -> str:
+    """Directory holding compscope's on-disk caches (XDG-aware)."""
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "compscope")
+
+
+class DiskCache:
+    """
+    Thread-safe persistent cache with per-entry expiry.
+    The SQLite connection is opened lazily on first use, so creating a
+    module-level cache has no import-time side effects.
+    """
+
+    def __init__(self, name: str, default_ttl: float = 86400 * 30, max_bytes: Optional[int] = DEFAULT_MAX_BYTES):
+        self.name        = name
+        self.path        = os.path.join(cache_dir(), f"{name}.sqlite")
+        self.default_ttl = default_ttl
+        self.max_bytes   = max_bytes  # None = no size cap, expiry only
+        self._lock       = threading.Lock()
+        self._conn       = None
+        self._disabled   = False
+        self._writes     = 0
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and not self._disabled:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False, isolation_level=None)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cache ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+                )
+                self._purge(conn)
+                self._conn = conn
+            except (OSError, sqlite3.Error) as e:
+                print(f"[Cache] Disk cache '{self.name}' disabled: {e}")
+                self._disabled = True
+        return self._conn
+
+    def _purge(self, conn: sqlite3.Connection):
+        """
+        Delete expired rows, then evict the soonest-expiring quarter of the
+        rest until stored values fit in max_bytes. Freed pages are reused
+        by later writes, which bounds the file size. Caller holds the lock.
+        """
+        try:
+            conn.execute("DELETE FROM cache WHERE expires < ?", (time.time(),))
+            if self.max_bytes is None:
+                return
+            while True:
+                size, rows = conn.execute(
+                    "SELECT COALESCE(SUM(LENGTH(value)), 0), COUNT(*) FROM cache"
+                ).fetchone()
+                if size <= self.max_bytes or not rows:
+                    return
+                conn.execute(
+                    "DELETE FROM cache WHERE key IN "
+                    "(SELECT key FROM cache ORDER BY expires LIMIT ?)",
+                    (max(1, rows // 4),),
+                )
+        except sqlite3.Error as e:
+            print(f"[Cache] Purge of '{self.name}' failed: {e}")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing/expired."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return default
+            try:
+                row = conn.execute(
+                    "SELECT value, expires FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[1] < time.time():
+                    conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    row = None
+            except sqlite3.Error:
+                return default
+        if row is None:
+            return default
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: float = None):
+        """Store value under key for ttl seconds (default_ttl if omitted)."""
+        expires = time.time() + (self.default_ttl if ttl is None else ttl)
+        payload = json.dumps(value)
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+                    (key, payload, expires),
+                )
+            except sqlite3.Error as e:
+                print(f"[Cache] Write to '{self.name}' failed: {e}")
+                return
+            self._writes += 1
+            if self._writes % PURGE_EVERY == 0:
+                self._purge(conn)
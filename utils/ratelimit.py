@@ -0,0 +1,77 @@
+"""
+Rate Limiting
+=============
+Token-bucket throttle shared by the API and scraper clients, so callers
+run at a provider's allowed rate instead of sleeping a fixed delay
+between every request.
+
+Modes (sustained requests per minute):
+  conservative   10
+  normal         30
+  fast           60
+  aggressive    100
+"""
+
+import threading
+import time
+
+
+RATE_MODES = {
+    "conservative": 10,
+    "normal":       30,
+    "fast":         60,
+    "aggressive":   100,
+}
+
+
+class TokenBucket:
+    """
+    Allows `burst` requests back-to-back, then refills at rate_per_min.
+    Default burst is ten seconds' worth of tokens (at least 1).
+
+    acquire() blocks until a token is available and also works as
+    `with limiter:`; acquire_async() is the asyncio equivalent. Tokens are
+    reserved under a lock, so threads and coroutines share one bucket
+    fairly in arrival order.
+    """
+
+    def __init__(self, rate_per_min: float, burst: int = None):
+        self.rate     = rate_per_min / 60.0
+        self.capacity = float(burst if burst is not None else max(1, int(rate_per_min // 6)))
+        self.tokens   = self.capacity
+        self.updated  = time.monotonic()
+        self._lock    = threading.Lock()
+
+    @classmethod
+    def for_mode(cls, mode: str = "normal", burst: int = None) -> "TokenBucket":
+        if mode not in RATE_MODES:
+            raise ValueError(f"Unknown rate mode {mode!r}; expected one of {', '.join(RATE_MODES)}")
+        return cls(RATE_MODES[mode], burst)
+
+    def _reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        with self._lock:
+            now          = time.monotonic()
+            self.tokens  = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def acquire(self):
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        import asyncio  # deferred: sync-only importers skip its ~25 ms import
+
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        return False
@@ -10,11 +10,20 @@ O*NET uses SOC-2019 (aligned with SOC-2018 with minor additions).
 """
 
 import re
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterator, Optional
 
 
-# SOC broad group → major group label
-SOC_MAJOR_GROUPS = {
+# str.translate table deleting every ASCII non-digit: ~1.5x faster than
+# re.sub(r"[^\d]", ...) on SOC-length strings. Only covers ASCII, so
+# pasted codes with an en dash or NBSP go through _NON_DIGIT_RE instead.
+_NON_DIGITS   = str.maketrans("", "", "".join(chr(c) for c in range(128) if not chr(c).isdigit()))
+_NON_DIGIT_RE = re.compile(r"\D")
+
+# SOC broad group → major group label. Read-only views, like the geo
+# tables: module constants that callers must not mutate.
+SOC_MAJOR_GROUPS = MappingProxyType({
     "11": "Management",
     "13": "Business & Financial Operations",
     "15": "Computer & Mathematical",
@@ -37,56 +46,83 @@ SOC_MAJOR_GROUPS = {
     "49": "Installation, Maintenance & Repair",
     "51": "Production",
     "53": "Transportation & Material Moving",
-}
+})
 
 # When detailed SOC data is unavailable in a metro, fall back to these
 # broader aggregate codes for the same major group.
-BROADER_FALLBACK = {
-    "15-1252.00": ["15-1250",   "15-1200",   "15-0000"],   # SWE → Developers → Comp Occ → All CS
-    "15-2051.00": ["15-2050",   "15-1200",   "15-0000"],   # Data Sci
-    "15-1243.00": ["15-1240",   "15-1200",   "15-0000"],   # DB Architect
-    "15-1244.00": ["15-1240",   "15-1200",   "15-0000"],   # Sysadmin
-    "15-1212.00": ["15-1210",   "15-1200",   "15-0000"],   # InfoSec
-    "29-1141.00": ["29-1140",   "29-1000",   "29-0000"],   # RN
-    "13-2051.00": ["13-2000",   "13-0000",   None],        # Financial analyst
-    "11-2021.00": ["11-2000",   "11-0000",   None],        # Mktg mgr
-}
+BROADER_FALLBACK = MappingProxyType({
+    "15-1252.00": ("15-1250",   "15-1200",   "15-0000"),   # SWE → Developers → Comp Occ → All CS
+    "15-2051.00": ("15-2050",   "15-1200",   "15-0000"),   # Data Sci
+    "15-1243.00": ("15-1240",   "15-1200",   "15-0000"),   # DB Architect
+    "15-1244.00": ("15-1240",   "15-1200",   "15-0000"),   # Sysadmin
+    "15-1212.00": ("15-1210",   "15-1200",   "15-0000"),   # InfoSec
+    "29-1141.00": ("29-1140",   "29-1000",   "29-0000"),   # RN
+    "13-2051.00": ("13-2000",   "13-0000",   None),        # Financial analyst
+    "11-2021.00": ("11-2000",   "11-0000",   None),        # Mktg mgr
+})
+
+
+# BROADER_FALLBACK with the None padding dropped, built once at import
+_FALLBACK_TUPLES = {k: tuple(c for c in v if c) for k, v in BROADER_FALLBACK.items()}
+
+
+def _digits(soc_code: str) -> str:
+    """Digits only: "15-1252.00" → "15125200". The one non-digit strip per call."""
+    if soc_code.isascii():
+        return soc_code.translate(_NON_DIGITS)
+    return _NON_DIGIT_RE.sub("", soc_code)
+
+
+def _clean_digits(digits: str, soc_code: str) -> str:
+    """XX-XXXX.XX from a 6- or 8-digit string; soc_code unchanged otherwise."""
+    if len(digits) == 6 or len(digits) == 8:
+        return f"{digits[:2]}-{digits[2:6]}.{digits[6:8] or '00'}"
+    return soc_code  # Return as-is if can't parse
+
+
+@lru_cache(maxsize=1024)
+def _generic_fallback(digits: str) -> tuple[str, ...]:
+    """Strip to broad group, then minor group, then all, keyed on the 6-digit code."""
+    mg = digits[:2]
+    return (
+        f"{mg}-{digits[2:5]}0",    # broad group (e.g. 15-1250)
+        f"{mg}-{digits[2:4]}00",   # minor group (e.g. 15-1200)
+        f"{mg}-0000",              # all in major (e.g. 15-0000)
+    )
 
 
 class SOCMapper:
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def clean(soc_code: str) -> str:
         """
         Normalize SOC code to XX-XXXX.XX format.
         Accepts: 151252, 15-1252, 15-1252.00, etc.
         """
-        digits = re.sub(r"[^\d]", "", soc_code)
-        if len(digits) == 6:
-            return f"{digits[:2]}-{digits[2:6]}.00"
-        if len(digits) == 8:
-            return f"{digits[:2]}-{digits[2:6]}.{digits[6:8]}"
-        return soc_code  # Return as-is if can't parse
+        return _clean_digits(_digits(soc_code), soc_code)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def for_bls_series(soc_code: str) -> str:
         """
         Convert SOC code to the 6-digit zero-padded format used
         in BLS OEWS series IDs (no hyphen, no decimal).
         e.g. "15-1252.00" → "151252"
         """
-        return re.sub(r"[^\d]", "", soc_code)[:6]
+        return _digits(soc_code)[:6]
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def major_group(soc_code: str) -> str:
         """Return the major group prefix (first 2 digits)."""
-        return re.sub(r"[^\d]", "", soc_code)[:2]
+        return _digits(soc_code)[:2]
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def describe(soc_code: str) -> str:
         """Return the major group label for a SOC code."""
-        mg = SOCMapper.major_group(soc_code)
-        return SOC_MAJOR_GROUPS.get(mg, "Unknown")
+        return SOC_MAJOR_GROUPS.get(_digits(soc_code)[:2], "Unknown")
 
     @staticmethod
     def fallback_chain(soc_code: str) -> list[str]:
@@ -96,18 +132,25 @@ class SOCMapper:
 
         e.g. "15-1252.00" → ["15-1250", "15-1200", "15-0000"]
         """
-        clean = SOCMapper.clean(soc_code)
+        return list(SOCMapper._fallback_chain(soc_code))
+
+    @staticmethod
+    def iter_fallback_chain(soc_code: str) -> Iterator[str]:
+        """
+        fallback_chain() as an iterator, for callers that stop at the first
+        code with data: walks the cached tuple without copying it to a list.
+        """
+        return iter(SOCMapper._fallback_chain(soc_code))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _fallback_chain(soc_code: str) -> tuple[str, ...]:
+        # Cached as a tuple; fallback_chain hands out a fresh list per call.
+        # One digit strip; the clean form and every fallback are slices of it.
+        digits = _digits(soc_code)
 
         # Check hardcoded map first
-        if clean in BROADER_FALLBACK:
-            return [c for c in BROADER_FALLBACK[clean] if c]
-
-        # Generic fallback: strip to minor group, then major group, then all
-        digits = re.sub(r"[^\d]", "", soc_code)
-        mg     = digits[:2]
-        minor  = digits[:4]
-        return [
-            f"{mg}-{minor}0",    # minor group (e.g. 15-1250)
-            f"{mg}-{mg}00",      # major group (e.g. 15-1200) — approximate
-            f"{mg}-0000",        # all in major (e.g. 15-0000)
-        ]
+        return (
+            _FALLBACK_TUPLES.get(_clean_digits(digits, soc_code))
+            or _generic_fallback(digits[:6])
+        )